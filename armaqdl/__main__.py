@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
 
+from multiprocessing import freeze_support
+
 from armaqdl import armaqdl
 
-armaqdl.main()
+if __name__ == "__main__":
+    freeze_support()  # Launch matrix worker processes in bundled executable
+    armaqdl.main()
@@ -0,0 +1,119 @@
+import contextlib
+import io
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+
+from . import armaqdl, config
+from .const import CONFIG_DIR
+
+# Launch resolution uses module state of armaqdl, calls are serialized within a process (use processes for parallelism)
+# Output is captured by redirecting sys.stdout and sys.stderr, which is process-global (output of other threads
+# printed during resolution is captured as well)
+_LOCK = threading.RLock()
+
+ERRORS = {
+    2: "Invalid Arma path",
+    3: "Invalid mod(s)",
+    4: "Invalid mission",
+    5: "Invalid server config",
+}
+
+
+@dataclass
+class LaunchPlan:
+    argv: list
+    code: int = 0
+    executable: str = ""
+    params: list = field(default_factory=list)
+    output: str = ""
+    error: str = ""
+    duration: float = 0.0
+
+    @property
+    def ok(self):
+        return self.code == 0 and bool(self.executable)
+
+    @property
+    def command(self):
+        return [self.executable] + self.params if self.executable else []
+
+
+@dataclass
+class LaunchResult:
+    plan: LaunchPlan
+    returncode: int = None
+    duration: float = 0.0
+    timeout: bool = False
+    executed: bool = False
+
+
+class Launcher:
+
+    def __init__(self, config_dir=CONFIG_DIR, settings=None, verbose=False, dry=False):
+        self.config_dir = config_dir
+        self.verbose = verbose
+        self.dry = dry
+
+        with io.StringIO() as f, contextlib.redirect_stdout(f):
+            if settings is None:
+                settings = config.load(config_dir)
+            if settings is None or not config.validate(settings):
+                raise ValueError(f"Invalid settings!\n{f.getvalue()}")
+        self.settings = settings
+
+    @contextlib.contextmanager
+    def _state(self):
+        with _LOCK:
+            previous = (armaqdl.VERBOSE, armaqdl.DRY, armaqdl.SETTINGS)
+            armaqdl.VERBOSE, armaqdl.DRY, armaqdl.SETTINGS = self.verbose, self.dry, self.settings
+            try:
+                yield
+            finally:
+                armaqdl.VERBOSE, armaqdl.DRY, armaqdl.SETTINGS = previous
+
+    def plan(self, argv):
+        # Resolve CLI arguments (mods, mission, flags) into a launch command without launching
+        plan = LaunchPlan(list(argv))
+        start = time.perf_counter()
+
+        with self._state(), io.StringIO() as f, contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
+            try:
+                args = armaqdl.create_parser().parse_args(plan.argv)
+                args.config = self.config_dir
+                plan.code, executable, params = armaqdl.prepare(args)
+            except SystemExit as e:
+                plan.code, executable, params = e.code, None, None
+                plan.error = "Invalid arguments"
+
+            plan.output = f.getvalue()
+
+        if params is not None:
+            plan.executable = str(executable)
+            plan.params = params
+        elif not plan.error:
+            plan.error = ERRORS.get(plan.code, "Nothing to launch")
+        plan.duration = time.perf_counter() - start
+
+        return plan
+
+    def run(self, plan, timeout=None):
+        # Launch resolved plan and wait for it to exit (nothing is launched in dry mode)
+        result = LaunchResult(plan)
+        if not plan.ok or self.dry:
+            return result
+
+        start = time.perf_counter()
+        try:
+            result.returncode = subprocess.run(plan.command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                               timeout=timeout).returncode
+            result.executed = True
+        except subprocess.TimeoutExpired:
+            result.timeout = True
+            result.executed = True
+        except OSError:
+            pass  # Not executable
+        result.duration = time.perf_counter() - start
+
+        return result
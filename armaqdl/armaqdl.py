@@ -1,7 +1,6 @@
 import argparse
+import json
 import os
-import re
-import shutil
 import subprocess
 import threading
 import time
@@ -13,7 +12,7 @@ if os.name == "nt":
 
 from ._version import __version__
 from .const import PACKAGE
-from . import config, update
+from . import cache, config, deploy, matrix, missions, profiler, server, update, watch
 
 
 VERBOSE = False
@@ -64,27 +63,48 @@ def find_arma_exe(executable):
     return path
 
 
-def open_last_rpt():
+def find_rpt_dir():
+    path = SETTINGS.get('log', {}).get('path', '')
+    if path:
+        return Path(path)
+
     if os.name == "nt":
-        log_open_delay = SETTINGS.get('log', {}).get('open_delay', 3)
-        print(f"Opening last log in {log_open_delay}s ...")
-        if not DRY:
-            time.sleep(log_open_delay)
+        return Path.home() / "AppData" / "Local" / "Arma 3"
 
-        rpt_path = Path.home() / "AppData" / "Local" / "Arma 3"
-        rpt_list = rpt_path.glob("*.rpt")
-        last_rpt = max(rpt_list, key=os.path.getctime)
+    return None
 
-        log_command = SETTINGS.get('log', {}).get('command', '')
-        if log_command:
-            log_command = [cmd.replace("$PATH", str(last_rpt.resolve())) for cmd in log_command]
-            log_command = [cmd.replace("$FILE", last_rpt.name) for cmd in log_command]
-            if not DRY:
-                subprocess.run(log_command, cwd=rpt_path, shell=True)
-        elif not DRY:
-            os.startfile(last_rpt)
-    else:
-        print("Warning! Opening last log only implemented for Windows.")
+
+def open_last_rpt(since=0):
+    rpt_path = find_rpt_dir()
+    if rpt_path is None:
+        print("Warning! Opening last log only implemented for Windows (or with 'path' in '[log]' settings).")
+        return
+
+    # Open as soon as a log newer than launch appears, fall back to the last log after open delay
+    log_open_delay = SETTINGS.get('log', {}).get('open_delay', 3)
+    print(f"Opening last log (waiting up to {log_open_delay}s) ...")
+
+    last_rpt = profiler.last_rpt(rpt_path) if rpt_path.exists() else None
+    if not DRY:
+        deadline = time.monotonic() + log_open_delay
+        while (last_rpt is None or os.path.getctime(last_rpt) < since) and time.monotonic() < deadline:
+            time.sleep(0.1)
+            last_rpt = profiler.last_rpt(rpt_path) if rpt_path.exists() else None
+
+    if last_rpt is None:
+        print(f"Error! No log found! [{rpt_path}]")
+        return
+
+    print(f"Log: [{last_rpt}]")
+
+    log_command = SETTINGS.get('log', {}).get('command', '')
+    if log_command:
+        log_command = [cmd.replace("$PATH", str(last_rpt.resolve())) for cmd in log_command]
+        log_command = [cmd.replace("$FILE", last_rpt.name) for cmd in log_command]
+        if not DRY:
+            subprocess.run(log_command, cwd=rpt_path, shell=True)
+    elif not DRY and os.name == "nt":
+        os.startfile(last_rpt)
 
 
 def build_mod(path, tool, launch_type=""):
@@ -98,6 +118,29 @@ def build_mod(path, tool, launch_type=""):
         if (tool == "b" or tool.lower() == build_tool.lower()) and (path / req_file).exists():
             print(f"=> Building [{build_tool}] ...")
 
+            # Content-addressed artifact cache (HEMTT launch type outputs only)
+            cache_settings = SETTINGS.get("cache", {})
+            cache_dir = cache_settings.get("path", "")
+            cache_key = None
+            if cache_dir and launch_type:
+                memo = cache.load_memo()
+                try:
+                    cache_key = cache.build_key(path, cmd, launch_type, memo, cache.tool_version(cmd))
+                    cache.save_memo(memo)
+                except OSError as e:
+                    print(f"  -> Cache skipped! Unable to hash sources: {e}")
+
+                entry = cache.lookup(cache_dir, cache_key) if cache_key else None
+                if entry:
+                    print(f"  -> Restoring from cache ... [{entry}]")
+                    try:
+                        if not DRY:
+                            cache.restore(entry, path / ".hemttout" / launch_type, link=cache_settings.get("link", False))
+                        print()
+                        return True
+                    except OSError as e:
+                        print(f"  -> Cache skipped! Unable to restore: {e}")
+
             if not DRY:
                 try:
                     subprocess.run(cmd, cwd=path, shell=True, check=True)
@@ -105,6 +148,17 @@ def build_mod(path, tool, launch_type=""):
                     print("  -> Failed! Build error.\n")
                     return False
 
+                output = path / ".hemttout" / launch_type
+                if cache_key and output.exists():
+                    try:
+                        if cache.store(cache_dir, cache_key, output):
+                            print(f"  -> Stored in cache. [{cache_key[:12]}]")
+                        for entry in cache.evict(cache_dir, cache_settings.get("max_size", 10240) * 1024 * 1024):
+                            if VERBOSE:
+                                print(f"  -> Evicted from cache. [{entry.name[:12]}]")
+                    except OSError as e:
+                        print(f"  -> Cache skipped! Unable to store: {e}")
+
             print()
             return True
 
@@ -115,7 +169,7 @@ def build_mod(path, tool, launch_type=""):
     return False
 
 
-def process_mods(mods, build_dev_tool):
+def process_mods(mods, build_dev_tool, sources=None):
     if not mods or "none" in mods:
         return ""
 
@@ -141,7 +195,8 @@ def process_mods(mods, build_dev_tool):
 
         if location not in SETTINGS.get("locations", {}).keys():
             # Absolute path
-            mod = f"{location}:{mod}"
+            if location != "abs":
+                mod = f"{location}:{mod}"  # Drive letter
             location = "abs"
             location_path = ""
         else:
@@ -215,6 +270,11 @@ def process_mods(mods, build_dev_tool):
         if not build_tool and build_dev_tool is not None and (location == "abs" or SETTINGS["locations"][location].get("build", False)):
             build_tool = build_dev_tool
 
+        # First HEMTT build (no output yet) uses location launch type, so it can be restored from cache
+        if build_tool and not launch_type and "t" not in marks_identifiers and (path / ".hemtt").is_dir():
+            launch_type = SETTINGS.get("locations", {}).get(location, {}).get("type", "dev")
+            path = path / ".hemttout" / launch_type
+
         print(f"{location}:{mod}  [{path}]")
 
         # Build
@@ -229,6 +289,10 @@ def process_mods(mods, build_dev_tool):
 
         paths.append(path)  # Marks success
 
+        # Collect buildable sources (watch mode)
+        if sources is not None and build_tool:
+            sources[f"{location}:{mod}"] = (path_build, build_tool, launch_type)
+
         # Optionals
         if "o" in marks_identifiers:
             optionals_index = marks_identifiers.index("o")
@@ -297,10 +361,19 @@ def process_mission(mission, profile):
             path = Path(mission) / "mission.sqm"
     else:
         # Profile path
-        path = Path.home() / "Documents" / "Arma 3 - Other Profiles" / profile / "missions" / mission / "mission.sqm"
+        path = missions.PROFILES_PATH / profile / "missions" / mission / "mission.sqm"
+
+        if not path.exists():
+            path = missions.PROFILES_PATH / profile / "mpmissions" / mission / "mission.sqm"
 
+        # Mission index (prefix or fuzzy match, current profile first)
         if not path.exists():
-            path = Path.home() / "Documents" / "Arma 3 - Other Profiles" / profile / "mpmissions" / mission / "mission.sqm"
+            matches = missions.find(missions.refresh(SETTINGS.get("missions", {}).get("paths", [])), mission, profile)
+            if matches:
+                if VERBOSE and len(matches) > 1:
+                    print(f"Mission matches: {[x['name'] for x in matches]}")
+
+                path = Path(matches[0]["path"]) / "mission.sqm"
 
     if not path.exists():
         print(f"Error! Mission not found! [{path}]")
@@ -322,28 +395,26 @@ def process_mission_server(mission):
     if mission.name == "mission.sqm":
         mission = mission.parent
 
-    # Copy to server
-    target = arma_path / "MPMissions" / mission.name
-    if target.exists():
-        shutil.rmtree(target)
+    # Deploy to server
+    mode = SETTINGS.get("server", {}).get("mission_deploy", "copy")
+    if mode not in deploy.MODES:
+        print(f"Error! Invalid mission deployment: {mode} (expected one of: {', '.join(deploy.MODES)})")
+        return None
 
-    print(f"Copying mission to server ... [{target}]\n")
-    shutil.copytree(mission, target)
+    target = arma_path / "MPMissions" / mission.name
+    print(f"Deploying mission to server ({mode}) ... [{target}]")
 
-    # Replace server.cfg mission template
-    cfg_path = arma_path / "server.cfg"
-    if cfg_path.exists():
-        if not DRY:
-            with open(cfg_path, "r+", encoding="utf-8") as f:
-                cfg = f.read()
-                cfg_replaced = re.sub('(template = ").+(";)', fr'\1{mission.name}\2', cfg)
-                f.seek(0)
-                f.write(cfg_replaced)
-                f.truncate()
-    else:
-        print(f"Error! server.cfg not found! [{cfg_path}]")
+    if not DRY:
+        start = time.perf_counter()
+        try:
+            written = deploy.deploy(mode, mission, target)
+        except OSError as e:
+            print(f"Error! Mission deployment failed!\n{e}")
+            return None
+        print(f"  -> Deployed in {time.perf_counter() - start:.3f}s ({written / 1024:.1f} KB written)")
+    print()
 
-    return ""
+    return mission.name
 
 
 def process_flags(args):
@@ -383,7 +454,7 @@ def process_flags(args):
     if args.join_server is not None:
         if args.join_server == "":
             ip = SETTINGS.get("server", {}).get("ip", "localhost")
-            port = SETTINGS.get("server", {}).get("port", 2302)
+            port = SETTINGS.get("server", {}).get("port", 2302) + args.instance * server.INSTANCE_PORT_OFFSET
             password = SETTINGS.get("server", {}).get("password", "test")
             flags.append(f"-connect={ip}")
             flags.append(f"-port={port}")
@@ -399,11 +470,64 @@ def process_flags(args):
     return flags
 
 
-def process_flags_server(args):
-    server_profile = SETTINGS.get("server", {}).get("profile", "Server")
+def process_config_server(args, mission, port):
+    arma_path = find_arma()
+    if not arma_path:
+        return None
+
+    server_settings = SETTINGS.get("server", {})
+    values = {
+        "instance": args.instance,
+        "port": port,
+        "password": server_settings.get("password", "test"),
+        "difficulty": server_settings.get("difficulty", "Custom"),
+        "mission": mission,
+        "missions": server.render_missions(([mission] if mission else []) + server_settings.get("missions", []),
+                                           server_settings.get("difficulty", "Custom")),
+    }
+
+    # Render server.cfg (default template is the one next to the executable) and optional basic.cfg per instance
+    flags = []
+    for name, flag in [("config", "-config"), ("basic", "-cfg")]:
+        template_path = server_settings.get(name, "server.cfg" if name == "config" else "")
+        if not template_path:
+            continue
+
+        template_path = Path(template_path)
+        if not template_path.is_absolute():
+            template_path = (args.config if name in server_settings else arma_path) / template_path
+
+        if not template_path.exists():
+            print(f"Error! Server {name} template not found! [{template_path}]")
+            return None
+
+        with open(template_path, "r", encoding="utf-8", newline="") as f:
+            text = server.render(f.read(), values, placeholders=name in server_settings)
+
+        cfg_path = arma_path / "ArmaQDL" / f"{template_path.stem}_{args.instance}{template_path.suffix}"
+        if not DRY:
+            written = server.write_atomic(cfg_path, text)
+            if VERBOSE:
+                print(f"Server {name}: [{cfg_path}] ({'written' if written else 'unchanged'})")
+
+        flags.append(f"{flag}={cfg_path}")
+
+    return flags
+
+
+def process_flags_server(args, mission=""):
+    server_settings = SETTINGS.get("server", {})
+    server_profile = server_settings.get("profile", "Server")
+    if args.instance:
+        server_profile += str(args.instance)
+    port = server_settings.get("port", 2302) + args.instance * server.INSTANCE_PORT_OFFSET
+
+    param_configs = process_config_server(args, mission, port)
+    if param_configs is None:
+        return None
 
-    flags = ["-server", "-hugepages", "-loadMissionToMemory", "-config=server.cfg",
-             f"-name={server_profile}"]
+    flags = ["-server", "-hugepages", "-loadMissionToMemory", f"-port={port}", f"-name={server_profile}"]
+    flags.extend(param_configs)
 
     if not args.no_filepatching:
         flags.append("-filePatching")
@@ -417,6 +541,11 @@ def process_flags_server(args):
     return flags
 
 
+def can_run(arma_path):
+    # Native executables (eg. stand-ins for testing) can be launched on any platform
+    return os.name == "nt" or (arma_path.suffix.lower() != ".exe" and os.access(arma_path, os.X_OK))
+
+
 def run_arma(arma_path, params):
     process_cmd = [arma_path] + params
 
@@ -426,17 +555,124 @@ def run_arma(arma_path, params):
     print(f"Running {arma_path.stem} ...")
     if not DRY:
         # Don't wait for process to finish (Popen() instead of run())
-        subprocess.Popen(process_cmd)
+        return subprocess.Popen(process_cmd)
 
+    return None
 
-def main():
-    # Generate new config
-    config.generate()
 
-    # Cleanup update files
-    update.clean()
+def profile_mods(arma_path, params, bisect):
+    param_mods = next((x for x in params if x.startswith("-mod=")), "")
+    mods = [x for x in param_mods[len("-mod="):].split(";") if x]
+    if not mods:
+        print("Nothing to profile - no mods.")
+        return 0
 
-    # Parse arguments
+    # Static cost
+    stats = profiler.mods_stats(mods)
+
+    # Load time from last log
+    times, lines = [None] * len(mods), [0] * len(mods)
+    rpt_dir = find_rpt_dir()
+    last_rpt = profiler.last_rpt(rpt_dir) if rpt_dir and rpt_dir.exists() else None
+    if last_rpt:
+        print(f"Log: [{last_rpt}]\n")
+        times, lines = profiler.parse_rpt(last_rpt, stats)
+    else:
+        print(f"Warning! No log found, load times not available. [{rpt_dir}]\n")
+
+    ranked = sorted(range(len(mods)), key=lambda i: (times[i] or 0, stats[i]["pbo_size"]), reverse=True)
+    print(f"{'Mod':<32} {'Load (s)':>9} {'Lines':>7} {'PBOs':>6} {'PBO size (MB)':>14} {'Files':>8}")
+    for i in ranked:
+        load_time = f"{times[i]:.2f}" if times[i] is not None else "-"
+        print(f"{profiler.mod_name(mods[i]):<32} {load_time:>9} {lines[i]:>7} {stats[i]['pbos']:>6} "
+              f"{stats[i]['pbo_size'] / 1024 / 1024:>14.1f} {stats[i]['files']:>8}")
+    print(f"\nTotal mods: {len(mods)}, PBOs: {sum(x['pbos'] for x in stats)}, "
+          f"size: {sum(x['pbo_size'] for x in stats) / 1024 / 1024:.1f} MB\n")
+
+    if not bisect:
+        return 0
+
+    if DRY:
+        print("Dry run - bisect skipped (requires launching).")
+        return 0
+
+    # Startup time deltas by launching subsets
+    startup_settings = SETTINGS.get("startup", {})
+    if not rpt_dir:
+        print("Error! Log folder unknown, set 'path' in '[log]' settings.")
+        return 1
+
+    others = [x for x in params if not x.startswith("-mod=")]
+
+    def measure(subset):
+        print(f"Measuring {len(subset)} mods ...")
+        elapsed = profiler.measure_startup([arma_path] + others + [f"-mod={';'.join(subset)}"], rpt_dir,
+                                           startup_settings.get("marker", "Mission id:"),
+                                           startup_settings.get("timeout", 300))
+        print(f"  -> {f'{elapsed:.2f}s' if elapsed is not None else 'Failed! Startup not detected.'}")
+        return elapsed
+
+    slowest, results = profiler.bisect(mods, measure)
+    if slowest is None:
+        print("Bisect failed! Startup with all mods not detected.")
+        return 1
+
+    print()
+    for subset, delta in results:
+        delta = f"{delta:+.2f}s" if delta is not None else "-"
+        print(f"Without {', '.join(profiler.mod_name(x) for x in subset)}: {delta}")
+    print(f"\nSlowest mod: {profiler.mod_name(slowest)}  [{slowest}]")
+
+    return 0
+
+
+def watch_mods(sources, arma_path, params, process, restart):
+    if not sources:
+        print("Nothing to watch - no mods with a build tool.")
+        return 0
+
+    watch_settings = SETTINGS.get("watch", {})
+
+    for name, (path, _, _) in sources.items():
+        print(f"Watching {name}  [{path}]")
+    print()
+
+    def on_change(names):
+        nonlocal process
+
+        built = False
+        for name in names:
+            path, build_tool, launch_type = sources[name]
+            print(f"Changed {name}  [{path}]")
+            built |= build_mod(path, build_tool, launch_type=launch_type)
+
+        if restart and built:
+            if process is not None and process.poll() is None:
+                print(f"Stopping {arma_path.stem} ...")
+                process.terminate()
+                try:
+                    process.wait(timeout=watch_settings.get("stop_timeout", 10))
+                except subprocess.TimeoutExpired:
+                    process.kill()
+
+            if can_run(arma_path):
+                process = run_arma(arma_path, params)
+            else:
+                print("Warning! Launching Arma only implemented for Windows.")
+
+    try:
+        watch.watch({name: path for name, (path, _, _) in sources.items()}, on_change,
+                    interval=watch_settings.get("interval", 1.0),
+                    debounce=watch_settings.get("debounce", 0.5),
+                    ignores=watch.IGNORE_DIRS + watch_settings.get("ignore", []),
+                    polling=watch_settings.get("polling", False))
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+
+    return 0
+
+
+def create_parser():
     parser = argparse.ArgumentParser(
         prog=PACKAGE,
         description=f"Quick development Arma 3 launcher v{__version__}",
@@ -448,6 +684,8 @@ def main():
     parser.add_argument("-s", "--server", action="store_true", help="start server")
     parser.add_argument("-j", "--join-server", nargs="?", const="", type=str, help="join server")
     parser.add_argument("-hc", "--headless", action="store_true", help="start headless client")
+    parser.add_argument("-i", "--instance", default=0, type=int,
+                        help="server instance to start or join (offsets port, separate server config)")
 
     parser.add_argument("-p", "--profile", default="", type=str, help="profile name")
     parser.add_argument("-nfp", "--no-filepatching", action="store_true", help="disable file patching")
@@ -463,14 +701,85 @@ def main():
     parser.add_argument("-b", "--build", metavar="TOOL", nargs="?", const="b", type=str,
                         help="build mods (auto-determine tool if unspecified)")
     parser.add_argument("-nl", "--no-log", action="store_true", help="don't open last log")
+    parser.add_argument("--profile-mods", action="store_true", help="rank mods by load cost (size and load time in last log)")
+    parser.add_argument("--bisect", action="store_true", help="launch subsets of mods to find the slowest mod (with --profile-mods)")
+    parser.add_argument("-w", "--watch", action="store_true", help="watch built mods and rebuild them on changes")
+    parser.add_argument("-r", "--restart", action="store_true", help="restart Arma after rebuilding in watch mode")
 
     parser.add_argument("--config", default=config.CONFIG_DIR, type=Path, help="load config from specified folder")
     parser.add_argument("--list", action="store_true", help="list active config locations and build tools")
+    parser.add_argument("--matrix", metavar="FILE", type=Path, help="resolve and run a launch matrix concurrently")
+    parser.add_argument("--report", metavar="FILE", type=Path, help="write launch matrix JSON report to file")
+    parser.add_argument("--missions", metavar="FILTER", nargs="?", const="", type=str,
+                        help="list missions from all profiles and mission paths by recency (optionally filtered)")
     parser.add_argument("--dry", action="store_true", help="dry run without actually launching anything (simulate)")
     parser.add_argument("--verbose", action="store_true", help="verbose output")
     parser.add_argument("--update", action="store_true", help="self-update")
     parser.add_argument("-v", "--version", action="store_true", help="show version")
 
+    return parser
+
+
+def prepare(args, sources=None):
+    if "none" in args.mods:
+        print("Warning! Launching without any mods (vanilla!)")
+    elif not args.mods:
+        print("Empty mod paths - use 'none' to launch without any mods (vanilla).")
+        return 0, None, None
+
+    # Arma path
+    arma_path = find_arma_exe(executable=args.executable)
+    if not arma_path:
+        print("Error! Invalid Arma path.")
+        return 2, None, None
+
+    # Mods
+    param_mods = process_mods(args.mods, args.build, sources=sources)
+    if param_mods is None:
+        print("Error! Invalid mod(s).")
+        return 3, None, None
+
+    # Mission path
+    param_mission = process_mission(args.mission, args.profile)
+    if param_mission is None:
+        print("Error! Invalid mission.")
+        return 4, None, None
+
+    server_mission = ""
+    if args.server:
+        server_mission = process_mission_server(param_mission)
+        if server_mission is None:
+            print("Error! Invalid mission.")
+            return 4, None, None
+        param_mission = ""  # Loaded through server config
+
+    # Flags
+    param_flags = process_flags_server(args, server_mission) if args.server else process_flags(args)
+    if param_flags is None:
+        print("Error! Invalid server config.")
+        return 5, None, None
+    if args.parameters is not None:
+        param_flags.extend(args.parameters)
+    print(f"Flags: {param_flags}\n")
+
+    params = param_flags
+    if param_mission:
+        params.append(str(param_mission))
+    if param_mods:
+        params.append(param_mods)
+
+    return 0, arma_path, params
+
+
+def main():
+    # Generate new config
+    config.generate()
+
+    # Cleanup update files
+    update.clean()
+
+    # Parse arguments
+    parser = create_parser()
     args = parser.parse_args()
 
     if args.version:
@@ -510,54 +819,60 @@ def main():
         print(epilog)
         return 0
 
-    if "none" in args.mods:
-        print("Warning! Launching without any mods (vanilla!)")
-    elif not args.mods:
-        print("Empty mod paths - use 'none' to launch without any mods (vanilla).")
+    if args.missions is not None:
+        mission_list = missions.refresh(SETTINGS.get("missions", {}).get("paths", []))
+        if args.missions:
+            mission_list = missions.find(mission_list, args.missions)
+
+        for mission in mission_list:
+            modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(mission["modified"]))
+            print(f"{modified}  {mission['profile'] or '-':<16} {mission['name']:<40} {mission['size'] / 1024:>8.1f} KB  [{mission['path']}]")
+
+        print(f"\nTotal missions: {len(mission_list)}")
         return 0
 
-    # Arma path
-    arma_path = find_arma_exe(executable=args.executable)
-    if not arma_path:
-        print("Error! Invalid Arma path.")
-        return 2
+    if args.matrix:
+        launch_matrix = matrix.load(args.matrix)
+        if launch_matrix is None:
+            return 1
 
-    # Mods
-    param_mods = process_mods(args.mods, args.build)
-    if param_mods is None:
-        print("Error! Invalid mod(s).")
-        return 3
+        report = matrix.run_matrix(launch_matrix, args.config, verbose=VERBOSE, dry=DRY)
+        for run in report["runs"]:
+            status = ("dry" if DRY else "ok") if matrix.succeeded(run, DRY) else "timeout" if run["timeout"] else "failed"
+            print(f"{run['name']:<40} {status:<8} resolve: {run['resolve_code']} ({run['resolve_time']:.3f}s)  "
+                  f"run: {run['returncode']} ({run['run_time']:.3f}s)")
+            if run["output"]:
+                print(f"  {run['output'].strip()}".replace("\n", "\n  "))
+        print(f"\nTotal runs: {len(report['runs'])} in {report['total_time']:.3f}s")
 
-    # Mission path
-    param_mission = process_mission(args.mission, args.profile)
-    if param_mission is None:
-        print("Error! Invalid mission.")
-        return 4
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"Report: [{args.report}]")
 
-    if args.server:
-        param_mission = process_mission_server(param_mission)
+        return 0 if all(matrix.succeeded(run, DRY) for run in report["runs"]) else 6
 
-    # Flags
-    param_flags = process_flags_server(args) if args.server else process_flags(args)
-    if args.parameters is not None:
-        param_flags.extend(args.parameters)
-    print(f"Flags: {param_flags}\n")
+    sources = {} if args.watch else None
+    ret, arma_path, params = prepare(args, sources=sources)
+    if params is None:
+        return ret
+
+    if args.profile_mods:
+        return profile_mods(arma_path, params, args.bisect)
 
     # Open log file
     if not args.no_log:
-        t = threading.Thread(target=open_last_rpt)
+        t = threading.Thread(target=open_last_rpt, args=(time.time(),))
         t.start()
 
     # Run
-    params = param_flags
-    if param_mission:
-        params.append(param_mission)
-    if param_mods:
-        params.append(param_mods)
-
-    if os.name == "nt":
-        run_arma(arma_path, params)
+    process = None
+    if can_run(arma_path):
+        process = run_arma(arma_path, params)
     else:
         print("Warning! Launching Arma only implemented for Windows.")
 
+    if args.watch:
+        return watch_mods(sources, arma_path, params, process, args.restart)
+
     return 0
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from .const import CONFIG_DIR, HASHES_FILE
+from .watch import IGNORE_DIRS
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def tree_hash(path, memo=None, ignores=IGNORE_DIRS):
+    # Hash of relative paths and contents, file hashes are reused from memo if size and modification time match
+    # Directory symlinks are followed (except cycles), broken symlinks are skipped, memo entries of removed files are pruned
+    if memo is None:
+        memo = {}
+
+    files = []
+    stack = [(str(path), frozenset())]
+    while stack:
+        current, parents = stack.pop()
+        real = os.path.realpath(current)
+        if real in parents:
+            continue  # Symlink cycle
+        parents = parents | {real}
+
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.name in ignores:
+                    continue
+                if entry.is_dir():
+                    stack.append((entry.path, parents))
+                elif entry.is_file():
+                    files.append(entry)
+
+    h = hashlib.sha256()
+    seen = set()
+    for entry in sorted(files, key=lambda x: x.path):
+        stat = entry.stat()
+        cached = memo.get(entry.path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            digest = cached[2]
+        else:
+            digest = file_hash(entry.path)
+            memo[entry.path] = [stat.st_mtime_ns, stat.st_size, digest]
+        seen.add(entry.path)
+
+        relative = Path(entry.path).relative_to(path).as_posix()
+        h.update(f"{relative}\0{digest}\n".encode("utf-8"))
+
+    prefix = os.path.join(str(path), "")
+    for removed in [x for x in memo if x.startswith(prefix) and x not in seen]:
+        del memo[removed]
+
+    return h.hexdigest()
+
+
+def tool_version(command):
+    # Output of `<tool> --version`, so upgrading the build tool invalidates cached builds
+    try:
+        return subprocess.run([command[0], "--version"], capture_output=True, text=True, timeout=30).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def build_key(path, command, launch_type, memo=None, version=""):
+    h = hashlib.sha256()
+    h.update(json.dumps([command, launch_type, version]).encode("utf-8"))
+    h.update(tree_hash(path, memo).encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_memo():
+    try:
+        with open(CONFIG_DIR / HASHES_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_memo(memo):
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CONFIG_DIR / f"{HASHES_FILE}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(memo, f)
+    os.replace(tmp, CONFIG_DIR / HASHES_FILE)
+
+
+def lookup(cache_dir, key):
+    entry = Path(cache_dir) / key
+    if entry.is_dir():
+        return entry
+    return None
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def restore(entry, target, link=False):
+    # Copy to temporary folder next to the target first and swap, so the current output is kept if the entry disappears
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{target.name}."))
+    try:
+        shutil.copytree(entry, tmp, symlinks=True, copy_function=_link_or_copy if link else shutil.copy2, dirs_exist_ok=True)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    if target.exists():
+        shutil.rmtree(target)
+    os.rename(tmp, target)
+
+    # Mark as recently used (LRU eviction)
+    now = time.time()
+    try:
+        os.utime(entry, (now, now))
+    except OSError:
+        pass  # Evicted in the meantime
+
+
+def store(cache_dir, key, source):
+    cache_dir = Path(cache_dir)
+    entry = cache_dir / key
+    if entry.exists():
+        return False
+
+    # Copy to unique temporary folder first and rename, so other workstations never see partial entries
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=cache_dir, prefix=f".{key}.")
+    try:
+        shutil.copytree(source, tmp, symlinks=True, dirs_exist_ok=True)
+        os.rename(tmp, entry)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if entry.exists():
+            return False  # Stored by someone else in the meantime
+        raise
+
+    return True
+
+
+def tree_size(path):
+    size = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            size += os.path.getsize(os.path.join(root, file))
+    return size
+
+
+def evict(cache_dir, max_size):
+    entries = [x for x in Path(cache_dir).iterdir() if x.is_dir() and not x.name.startswith(".")]
+    entries = [(x.stat().st_mtime, tree_size(x), x) for x in entries]
+    total = sum(x[1] for x in entries)
+
+    evicted = []
+    for _, size, entry in sorted(entries, key=lambda x: x[0]):
+        if total <= max_size:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+        evicted.append(entry)
+
+    return evicted
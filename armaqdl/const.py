@@ -7,5 +7,9 @@ PACKAGE = __name__.split(".")[0]
 CONFIG_DIR = Path(PlatformDirs("ArmaQDL", False, roaming=True).user_config_dir)
 SETTINGS_FILE = "settings.toml"
 LATEST_FILE = "latest"
+HASHES_FILE = "hashes.json"
+MISSIONS_FILE = "missions.json"
+DEPLOY_DIR = "deploy"
+RPT_FILE = "rpt.json"
 
 WINGET_PATH = Path(PlatformDirs("WinGet", "Microsoft").user_config_dir) / "Links"
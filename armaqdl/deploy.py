@@ -0,0 +1,231 @@
+import hashlib
+import json
+import os
+import shutil
+import stat
+import struct
+from pathlib import Path
+
+from .const import CONFIG_DIR, DEPLOY_DIR
+
+CHUNK_SIZE = 1024 * 1024
+PBO_VERSION = 0x56657273  # "Vers"
+
+
+def is_link(path):
+    if os.path.islink(path):
+        return True
+    try:
+        attributes = getattr(os.lstat(path), "st_file_attributes", 0)
+    except OSError:
+        return False
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)  # Junction
+
+
+def remove(path):
+    # Never follow links, removing them must not touch the linked source mission
+    if is_link(path):
+        try:
+            os.unlink(path)
+        except (IsADirectoryError, PermissionError):
+            os.rmdir(path)  # Windows directory link or junction
+    elif path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        os.remove(path)
+
+
+def list_files(source):
+    files = []
+    for root, dirs, names in os.walk(source):
+        dirs.sort()
+        for name in sorted(names):
+            path = Path(root) / name
+            files.append((path.relative_to(source), path.stat()))
+    return files
+
+
+def deploy_copy(source, target):
+    # Delta copy, only files with different size or modification time are copied
+    if is_link(target) or target.is_file():
+        remove(target)
+    target.mkdir(parents=True, exist_ok=True)
+
+    written = 0
+    files = list_files(source)
+    for relative, source_stat in files:
+        target_file = target / relative
+        try:
+            target_stat = target_file.stat()
+            if target_stat.st_size == source_stat.st_size and int(target_stat.st_mtime) == int(source_stat.st_mtime):
+                continue
+        except OSError:
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+
+        shutil.copy2(source / relative, target_file)
+        written += source_stat.st_size
+
+    # Remove files no longer in source
+    expected = {relative for relative, _ in files}
+    for relative, _ in list_files(target):
+        if relative not in expected:
+            os.remove(target / relative)
+    for root, dirs, _ in os.walk(target, topdown=False):
+        for name in dirs:
+            if not any((Path(root) / name).iterdir()):
+                os.rmdir(Path(root) / name)
+
+    return written
+
+
+def deploy_hardlink(source, target):
+    remove(target)
+    shutil.copytree(source, target, copy_function=os.link)
+    return 0
+
+
+def deploy_symlink(source, target):
+    remove(target)
+    os.symlink(source.resolve(), target, target_is_directory=True)
+    return 0
+
+
+def deploy_junction(source, target):
+    if os.name != "nt":
+        raise OSError("Junctions are only supported on Windows")
+
+    import _winapi
+
+    remove(target)
+    _winapi.CreateJunction(str(source.resolve()), str(target))
+    return 0
+
+
+def pbo_entry(name, size, timestamp):
+    return name.encode("utf-8") + b"\0" + struct.pack("<5I", 0, size, 0, timestamp & 0xFFFFFFFF, size)
+
+
+def pbo_entries(source):
+    entries = []
+    for relative, source_stat in list_files(source):
+        name = str(relative).replace("/", "\\")
+        entries.append([name, source_stat.st_size, source_stat.st_mtime_ns])
+    return entries
+
+
+def write_pbo(source, target, entries):
+    # Stream all files into a new PBO and return data offsets of entries
+    header = b"\0" + struct.pack("<5I", PBO_VERSION, 0, 0, 0, 0) + b"\0"
+    header_offsets = []
+    for name, size, mtime_ns in entries:
+        header_offsets.append(len(header) + len(name.encode("utf-8")) + 1)
+        header += pbo_entry(name, size, mtime_ns // 10**9)
+    header += b"\0" + struct.pack("<5I", 0, 0, 0, 0, 0)
+
+    offsets = []
+    sha = hashlib.sha1()
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        sha.update(header)
+        offset = len(header)
+
+        for name, size, _ in entries:
+            offsets.append(offset)
+            with open(source / name.replace("\\", "/"), "rb") as data:
+                for chunk in iter(lambda: data.read(CHUNK_SIZE), b""):
+                    f.write(chunk)
+                    sha.update(chunk)
+            offset += size
+
+        f.write(b"\0" + sha.digest())
+    os.replace(tmp, target)
+
+    return header_offsets, offsets
+
+
+def patch_pbo(source, target, entries, changed, header_offsets, offsets):
+    # Same layout, rewrite changed entries in place and recalculate the checksum
+    written = 0
+    with open(target, "r+b") as f:
+        for i in changed:
+            name, _, mtime_ns = entries[i]
+            f.seek(header_offsets[i] + 12)  # Timestamp field
+            f.write(struct.pack("<I", (mtime_ns // 10**9) & 0xFFFFFFFF))
+            f.seek(offsets[i])
+            with open(source / name.replace("\\", "/"), "rb") as data:
+                for chunk in iter(lambda: data.read(CHUNK_SIZE), b""):
+                    f.write(chunk)
+                    written += len(chunk)
+
+        end = f.seek(0, os.SEEK_END) - 21
+        sha = hashlib.sha1()
+        f.seek(0)
+        remaining = end
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            sha.update(chunk)
+            remaining -= len(chunk)
+        f.write(b"\0" + sha.digest())
+
+    return written + 4 * len(changed) + 21
+
+
+def deploy_pbo(source, target):
+    target = target.with_name(f"{target.name}.pbo")
+    cache_path = CONFIG_DIR / DEPLOY_DIR / f"{target.name}.json"
+
+    entries = pbo_entries(source)
+
+    # Cached header is only valid if the PBO was not touched since it was written
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        target_stat = target.stat()
+        if cached["target"] != str(target) or cached["size"] != target_stat.st_size or cached["mtime"] != target_stat.st_mtime_ns:
+            cached = None
+    except (OSError, ValueError, KeyError):
+        cached = None
+
+    if cached and [x[:2] for x in cached["entries"]] == [x[:2] for x in entries]:
+        changed = [i for i, entry in enumerate(entries) if entry[2] != cached["entries"][i][2]]
+        if not changed:
+            return 0
+        written = patch_pbo(source, target, entries, changed, cached["header_offsets"], cached["offsets"])
+        header_offsets, offsets = cached["header_offsets"], cached["offsets"]
+    else:
+        header_offsets, offsets = write_pbo(source, target, entries)
+        written = target.stat().st_size
+
+    target_stat = target.stat()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "target": str(target),
+            "size": target_stat.st_size,
+            "mtime": target_stat.st_mtime_ns,
+            "entries": entries,
+            "header_offsets": header_offsets,
+            "offsets": offsets,
+        }, f)
+
+    return written
+
+
+MODES = {
+    "copy": deploy_copy,
+    "hardlink": deploy_hardlink,
+    "symlink": deploy_symlink,
+    "junction": deploy_junction,
+    "pbo": deploy_pbo,
+}
+
+
+def deploy(mode, source, target):
+    # Remove the other form (folder or PBO) of the mission, the server could load either
+    if mode == "pbo":
+        remove(target)
+    else:
+        remove(target.with_name(f"{target.name}.pbo"))
+
+    return MODES[mode](source, target)
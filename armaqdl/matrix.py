@@ -0,0 +1,138 @@
+import contextlib
+import io
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import toml
+
+from . import api, armaqdl, missions
+
+_launcher = None
+
+
+def _init_worker(config_dir, verbose, dry):
+    global _launcher
+    _launcher = api.Launcher(config_dir, verbose=verbose, dry=dry)
+
+
+def _plan(argv):
+    return _launcher.plan(argv)
+
+
+def parse_run(argv):
+    # Parsed run arguments (instance None if not given), None for invalid arguments (reported when resolved)
+    parser = armaqdl.create_parser()
+    parser.set_defaults(instance=None)
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            return parser.parse_args(argv)
+    except SystemExit:
+        return None
+
+
+def has_side_effects(args):
+    # Builds, mission deployment and server config rendering write to shared folders
+    build_marks = [mark for mod in args.mods for mark in mod.split(":")[2:] if mark.lower().startswith("b")]
+    return args.server or args.build is not None or bool(build_marks)
+
+
+def load(path):
+    try:
+        matrix = toml.load(path)
+    except (OSError, TypeError) as e:
+        print(f"Error! Invalid matrix file!\n{e}")
+        return None
+    except toml.TomlDecodeError as e:
+        print(f"Error! Invalid matrix format!\n{e}")
+        return None
+
+    for i, run in enumerate(matrix.get("runs", [])):
+        if not isinstance(run.get("args"), list):
+            print(f"Error! No 'args' list defined for run {i}.")
+            return None
+
+    # Concurrent servers must not share a rendered server config and port
+    instances = {}
+    for i, run in enumerate(matrix.get("runs", [])):
+        args = parse_run(run["args"])
+        if args is not None and args.server and args.instance is not None:
+            if args.instance in instances:
+                print(f"Error! Server instance {args.instance} used by runs {instances[args.instance]} and {i}.")
+                return None
+            instances[args.instance] = i
+
+    return matrix
+
+
+def run_matrix(matrix, config_dir, verbose=False, dry=False):
+    start = time.perf_counter()
+    launcher = api.Launcher(config_dir, verbose=verbose, dry=dry)
+
+    runs = matrix.get("runs", [])
+    parsed = [parse_run(run["args"]) for run in runs]
+    used = {args.instance for args in parsed if args is not None and args.server and args.instance is not None}
+    argvs = []
+    for run, args in zip(runs, parsed):
+        argv = list(run["args"])
+        if matrix.get("executable"):
+            argv += ["-e", matrix["executable"]]
+
+        # Separate instance for every server run
+        if args is not None and args.server and args.instance is None:
+            instance = next(x for x in itertools.count() if x not in used)
+            used.add(instance)
+            argv += ["-i", str(instance)]
+
+        argvs.append(argv)
+
+    # Refresh mission index once, workers only read it
+    missions.refresh(launcher.settings.get("missions", {}).get("paths", []))
+
+    # Resolve runs building mods or deploying missions one at a time (same sources or targets in multiple runs),
+    # others concurrently (module state per process)
+    serial = [i for i, args in enumerate(parsed) if args is not None and has_side_effects(args)]
+    concurrent = [i for i in range(len(argvs)) if i not in serial]
+
+    plans = [None] * len(argvs)
+    for i in serial:
+        plans[i] = launcher.plan(argvs[i])
+    if concurrent:
+        workers = min(matrix.get("workers", os.cpu_count() or 1), len(concurrent))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config_dir, verbose, dry)) as executor:
+            for i, plan in zip(concurrent, executor.map(_plan, [argvs[i] for i in concurrent])):
+                plans[i] = plan
+
+    # Run with concurrency limit
+    results = []
+    if plans:
+        concurrency = max(1, matrix.get("concurrency", 1))
+        timeout = matrix.get("timeout")
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(lambda plan: launcher.run(plan, timeout=timeout), plans))
+
+    report = {"total_time": 0.0, "runs": []}
+    for run, result in zip(runs, results):
+        plan = result.plan
+        report["runs"].append({
+            "name": run.get("name", " ".join(run["args"])),
+            "args": plan.argv,
+            "command": plan.command,
+            "resolve_code": plan.code,
+            "error": plan.error,
+            "resolve_time": plan.duration,
+            "returncode": result.returncode,
+            "run_time": result.duration,
+            "timeout": result.timeout,
+            "executed": result.executed,
+            "output": plan.output if verbose or not plan.ok else "",
+        })
+    report["total_time"] = time.perf_counter() - start
+
+    return report
+
+
+def succeeded(run, dry=False):
+    # Dry runs are only resolved
+    return run["resolve_code"] == 0 and (dry or run["returncode"] == 0)
@@ -0,0 +1,104 @@
+import difflib
+import json
+import os
+from pathlib import Path
+
+from .const import CONFIG_DIR, MISSIONS_FILE
+
+PROFILES_PATH = Path.home() / "Documents" / "Arma 3 - Other Profiles"
+MISSION_FOLDERS = ["missions", "mpmissions"]
+
+
+def find_roots(extra_paths=()):
+    roots = []
+
+    if PROFILES_PATH.is_dir():
+        for profile in sorted(os.scandir(PROFILES_PATH), key=lambda x: x.name):
+            if profile.is_dir():
+                for folder in MISSION_FOLDERS:
+                    roots.append((profile.name, Path(profile.path) / folder))
+
+    for path in extra_paths:
+        roots.append(("", Path(path)))
+
+    return [(profile, root) for profile, root in roots if root.is_dir()]
+
+
+def load_index():
+    try:
+        with open(CONFIG_DIR / MISSIONS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(index):
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CONFIG_DIR / f"{MISSIONS_FILE}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(tmp, CONFIG_DIR / MISSIONS_FILE)
+
+
+def scan_root(root):
+    return sorted(entry.name for entry in os.scandir(root) if entry.is_dir())
+
+
+def refresh(extra_paths=()):
+    index = load_index()
+    new_index = {}
+    missions = []
+
+    for profile, root in find_roots(extra_paths):
+        key = str(root)
+        cached = index.get(key, {})
+
+        # Mission folders are only listed again if the root folder changed (missions added, removed or renamed)
+        mtime = root.stat().st_mtime_ns
+        names = cached.get("names") if cached.get("mtime") == mtime else None
+        if names is None:
+            names = scan_root(root)
+        new_index[key] = {"mtime": mtime, "names": names}
+
+        for name in names:
+            path = root / name
+            try:
+                stat = (path / "mission.sqm").stat()
+            except OSError:
+                continue  # Not a mission (or removed)
+
+            missions.append({
+                "name": name,
+                "terrain": name.rsplit(".", 1)[1] if "." in name else "",
+                "profile": profile,
+                "path": str(path),
+                "modified": stat.st_mtime,
+                "size": stat.st_size,
+            })
+
+    if new_index != index:
+        save_index(new_index)
+
+    return sorted(missions, key=lambda x: x["modified"], reverse=True)
+
+
+def find(missions, query, profile=None):
+    # Exact, then prefix, then fuzzy name matches (case-insensitive) across all profiles
+    # Within a match tier, missions in the given profile come first, then most recent
+    query = query.lower()
+    names = [x["name"].lower() for x in missions]
+
+    def other_profile(mission):
+        return profile is not None and mission["profile"] != profile
+
+    matches = [x for x, name in zip(missions, names) if name == query]
+    if not matches:
+        matches = [x for x, name in zip(missions, names) if name.startswith(query)]
+    matches = sorted(matches, key=lambda x: (other_profile(x), -x["modified"]))
+
+    if not matches:
+        close = difflib.get_close_matches(query, set(names), n=5, cutoff=0.6)
+        matches = sorted([x for x, name in zip(missions, names) if name in close],
+                         key=lambda x: (close.index(x["name"].lower()), other_profile(x), -x["modified"]))
+
+    return matches
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .const import CONFIG_DIR, RPT_FILE
+
+RPT_TIME = re.compile(r"^\s*(\d+):(\d\d):(\d\d)(?:\.(\d+))?\s")
+RPT_WORD = re.compile(r"[a-z0-9_@]+")
+
+
+def mod_stats(path):
+    stats = {"path": str(path), "files": 0, "size": 0, "pbos": 0, "pbo_size": 0, "pbo_names": []}
+
+    for root, _, files in os.walk(path):
+        for file in files:
+            size = os.path.getsize(os.path.join(root, file))
+            stats["files"] += 1
+            stats["size"] += size
+            if file.lower().endswith(".pbo"):
+                stats["pbos"] += 1
+                stats["pbo_size"] += size
+                stats["pbo_names"].append(file[:-4].lower())
+
+    return stats
+
+
+def mods_stats(paths, workers=None):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(mod_stats, paths))
+
+
+def mod_name(path):
+    path = Path(path)
+    if path.parent.name == ".hemttout":
+        return path.parent.parent.name  # HEMTT launch type output
+    return path.name
+
+
+def mod_tokens(stats):
+    # Names identifying a mod in log lines (folder name, PBO names and their tags, eg. "ace" of "ace_common")
+    tokens = {}
+    for i, mod in enumerate(stats):
+        name = mod_name(mod["path"]).lower()
+        tags = [x.split("_", 1)[0] for x in mod["pbo_names"] if "_" in x]
+        for token in [name, name.lstrip("@")] + mod["pbo_names"] + tags:
+            if len(token) > 2:
+                tokens.setdefault(token, i)
+    return tokens
+
+
+def find_mod(line, tokens):
+    # Index of the first mod mentioned in the line (whole words only), None if none
+    for word in RPT_WORD.findall(line.lower()):
+        i = tokens.get(word, tokens.get(word.lstrip("@")))
+        if i is not None:
+            return i
+    return None
+
+
+def parse_time(line):
+    match = RPT_TIME.match(line)
+    if not match:
+        return None
+
+    hours, minutes, seconds, fraction = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds) + (float(f"0.{fraction}") if fraction else 0)
+
+
+def last_rpt(rpt_dir):
+    rpt_list = list(Path(rpt_dir).glob("*.rpt"))
+    if not rpt_list:
+        return None
+    return max(rpt_list, key=os.path.getctime)
+
+
+def parse_rpt(rpt_path, stats):
+    # Time between consecutive timestamped lines is attributed to the mod mentioned in the later line
+    # Parsing continues where the previous run stopped if the log and mods did not change
+    tokens = mod_tokens(stats)
+    tokens_hash = hashlib.sha256(json.dumps(sorted(tokens.items())).encode("utf-8")).hexdigest()
+
+    state = {}
+    try:
+        with open(CONFIG_DIR / RPT_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    size = rpt_path.stat().st_size
+    if state.get("path") != str(rpt_path) or state.get("tokens") != tokens_hash or state.get("offset", 0) > size:
+        state = {"path": str(rpt_path), "tokens": tokens_hash, "offset": 0, "previous": None,
+                 "times": [0.0] * len(stats), "lines": [0] * len(stats)}
+
+    with open(rpt_path, "rb") as f:
+        f.seek(state["offset"])
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # Incomplete line, still being written
+
+            state["offset"] += len(raw)
+            line = raw.decode("utf-8", errors="replace")
+
+            current = parse_time(line)
+            if current is None:
+                continue
+
+            previous = state["previous"]
+            if previous is not None and current < previous:
+                current += 24 * 3600 * ((previous - current) // (24 * 3600) + 1)  # Midnight
+            state["previous"] = current
+
+            i = find_mod(line, tokens)
+            if i is not None:
+                state["lines"][i] += 1
+                if previous is not None:
+                    state["times"][i] += current - previous
+
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    with open(CONFIG_DIR / RPT_FILE, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+    return state["times"], state["lines"]
+
+
+def measure_startup(command, rpt_dir, marker, timeout):
+    # Launch and wait for the marker in a new log, returns seconds or None
+    existing = set(Path(rpt_dir).glob("*.rpt"))
+    start = time.perf_counter()
+    process = subprocess.Popen(command)
+
+    rpt, offset, elapsed = None, 0, None
+    try:
+        while time.perf_counter() - start < timeout and process.poll() is None:
+            time.sleep(0.1)
+
+            if rpt is None:
+                new = set(Path(rpt_dir).glob("*.rpt")) - existing
+                if not new:
+                    continue
+                rpt = new.pop()
+
+            with open(rpt, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+            lines = data.rsplit(b"\n", 1)
+            if len(lines) == 2:
+                offset += len(lines[0]) + 1
+                if marker.encode("utf-8") in lines[0]:
+                    elapsed = time.perf_counter() - start
+                    break
+    finally:
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    return elapsed
+
+
+def bisect(mods, measure):
+    # Repeatedly leave out each half of the remaining candidates, following the half whose removal saves the most time
+    results = []
+    full = measure(mods)
+    if full is None:
+        return None, results
+
+    candidates = mods
+    while len(candidates) > 1:
+        halves = [candidates[:len(candidates) // 2], candidates[len(candidates) // 2:]]
+        deltas = []
+        for half in halves:
+            elapsed = measure([x for x in mods if x not in half])
+            delta = full - elapsed if elapsed is not None else None
+            results.append((half, delta))
+            deltas.append(delta if delta is not None else float("-inf"))
+
+        candidates = halves[0] if deltas[0] >= deltas[1] else halves[1]
+
+    return candidates[0], results
@@ -0,0 +1,51 @@
+import os
+import re
+import tempfile
+from string import Template
+
+INSTANCE_PORT_OFFSET = 10  # Every server uses a few consecutive ports
+
+
+def render_missions(missions, difficulty):
+    block = "class Missions {\n"
+    for i, mission in enumerate(missions):
+        block += f"    class Mission{i} {{\n"
+        block += f"        template = \"{mission}\";\n"
+        if difficulty:
+            block += f"        difficulty = \"{difficulty}\";\n"
+        block += "    };\n"
+    block += "};"
+    return block
+
+
+def render(text, values, placeholders=False):
+    # Placeholders are only substituted in custom templates, plain configs are kept as they are
+    if placeholders:
+        text = Template(text).safe_substitute(values)
+    elif values.get("mission"):
+        # Replace mission template
+        text = re.sub('(template = ").+(";)', lambda m: f"{m[1]}{values['mission']}{m[2]}", text)
+
+    return text
+
+
+def write_atomic(path, text):
+    # Skip unchanged, otherwise write to a unique temporary file and rename over (concurrent launches never see partial files)
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except OSError:
+        os.remove(tmp)
+        raise
+
+    return True
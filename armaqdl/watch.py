@@ -0,0 +1,132 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+IGNORE_DIRS = [".git", ".hemttout", "__pycache__"]
+
+
+def snapshot(path, ignores=IGNORE_DIRS):
+    # Iterative scandir walk (stat comes from the directory entry where the OS provides it)
+    files = {}
+    stack = [str(path)]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name in ignores:
+                        continue
+
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            stat = entry.stat(follow_symlinks=False)
+                            files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        continue  # Removed while scanning
+        except OSError:
+            continue
+
+    return files
+
+
+def is_ignored(path, root, ignores=IGNORE_DIRS):
+    try:
+        parts = Path(path).relative_to(root).parts
+    except ValueError:
+        return False
+    return any(part in ignores for part in parts)
+
+
+class _EventHandler(FileSystemEventHandler):
+
+    def __init__(self, name, root, ignores, pending, lock):
+        super().__init__()
+        self.name = name
+        self.root = root
+        self.ignores = ignores
+        self.pending = pending
+        self.lock = lock
+
+    def on_any_event(self, event):
+        if event.is_directory and event.event_type == "modified":
+            return  # Directory modification accompanies every file change inside it
+        if is_ignored(event.src_path, self.root, self.ignores):
+            return
+
+        with self.lock:
+            self.pending[self.name] = time.monotonic()
+
+
+def take_ready(pending, lock, debounce):
+    # Changes ready once no new change was seen for the debounce duration
+    now = time.monotonic()
+    with lock:
+        ready = [name for name, changed in pending.items() if now - changed >= debounce]
+        for name in ready:
+            del pending[name]
+    return ready
+
+
+def watch_events(sources, on_change, debounce=0.5, ignores=IGNORE_DIRS):
+    pending = {}
+    lock = threading.Lock()
+
+    observer = Observer()
+    for name, path in sources.items():
+        observer.schedule(_EventHandler(name, path, ignores, pending, lock), str(path), recursive=True)
+    observer.start()
+
+    try:
+        while observer.is_alive():
+            time.sleep(debounce / 2)
+
+            ready = take_ready(pending, lock, debounce)
+            if ready:
+                on_change(ready)
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def watch_polling(sources, on_change, interval=1.0, debounce=0.5, ignores=IGNORE_DIRS, load=0.1):
+    snapshots = {name: snapshot(path, ignores) for name, path in sources.items()}
+    pending = {}
+    lock = threading.Lock()
+    delay = interval
+
+    while True:
+        time.sleep(delay)
+
+        scan_start = time.monotonic()
+        for name, path in sources.items():
+            current = snapshot(path, ignores)
+            if current != snapshots[name]:
+                snapshots[name] = current
+                pending[name] = time.monotonic()
+        scan_time = time.monotonic() - scan_start
+
+        # Back off on large trees to keep scanning below the given CPU load
+        delay = max(interval, scan_time / load - scan_time)
+
+        ready = take_ready(pending, lock, debounce)
+        if ready:
+            on_change(ready)
+
+
+def watch(sources, on_change, interval=1.0, debounce=0.5, ignores=IGNORE_DIRS, polling=False):
+    if not polling and Observer is not None:
+        print("Watching for changes (events) ...")
+        watch_events(sources, on_change, debounce=debounce, ignores=ignores)
+    else:
+        print("Watching for changes (polling) ...")
+        watch_polling(sources, on_change, interval=interval, debounce=debounce, ignores=ignores)
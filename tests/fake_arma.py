@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# Stand-in for the Arma executable (launch with `-e`)
+# Writes an RPT into ARMAQDL_FAKE_RPT folder, listens on the server port with `-server` and runs until terminated
+
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+RUNNING = True
+
+
+def stop(signum, frame):
+    global RUNNING
+    RUNNING = False
+
+
+def rpt_time(start):
+    elapsed = int(time.monotonic() - start)
+    return f"{elapsed // 3600:>2}:{elapsed // 60 % 60:02}:{elapsed % 60:02}"
+
+
+def main():
+    started = time.time()
+    start = time.monotonic()
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    # Detach from inherited output (like a GUI application), so the launcher's output ends when it exits
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    params = sys.argv[1:]
+    server = "-server" in params
+    name = "arma3server_x64" if server else "arma3_x64"
+
+    sock = None
+    if server:
+        port = next((int(x[len("-port="):]) for x in params if x.startswith("-port=")), 2302)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", port))
+        sock.listen()
+        sock.settimeout(0.1)
+
+    rpt_dir = Path(os.environ.get("ARMAQDL_FAKE_RPT", "."))
+    rpt_dir.mkdir(parents=True, exist_ok=True)
+    rpt = rpt_dir / f"{name}_{time.strftime('%Y-%m-%d_%H-%M-%S')}_{os.getpid()}.rpt"
+
+    with open(rpt, "w", encoding="utf-8") as f:
+        f.write("=====================================================================\n")
+        f.write(f"== {name}\n")
+        f.write(f"== {' '.join(params)}\n")
+        f.write("=====================================================================\n")
+        f.write(f"Started: {started:.6f}\n")
+        f.write(f"PID: {os.getpid()}\n")
+        for param in params:
+            if param.startswith("-mod="):
+                for mod in param[len("-mod="):].split(";"):
+                    f.write(f"{rpt_time(start)} Loading mod {mod}\n")
+        f.write(f"{rpt_time(start)} Mission id: fake\n")
+
+    while RUNNING:
+        if sock:
+            try:
+                conn, _ = sock.accept()
+                conn.close()
+            except OSError:
+                pass
+        else:
+            time.sleep(0.1)
+
+    if sock:
+        sock.close()
+
+    with open(rpt, "a", encoding="utf-8") as f:
+        f.write(f"{rpt_time(start)} Class destroyed with lock count 0\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
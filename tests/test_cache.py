@@ -0,0 +1,157 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from armaqdl import armaqdl, cache
+
+
+class UnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "mod"
+        self.cache_dir = Path(self.tmp.name) / "cache"
+        (self.path / ".hemtt").mkdir(parents=True)
+        (self.path / ".hemtt" / "project.toml").write_text("name = 'test'")
+        (self.path / "addons" / "main").mkdir(parents=True)
+        (self.path / "addons" / "main" / "config.cpp").write_text("class CfgPatches {};")
+
+        patcher = mock.patch.object(cache, "CONFIG_DIR", Path(self.tmp.name) / "config")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_output(self, content="pbo"):
+        output = self.path / ".hemttout" / "dev" / "addons"
+        output.mkdir(parents=True, exist_ok=True)
+        (output / "main.pbo").write_text(content)
+        return output.parent
+
+    def test_tree_hash(self):
+        memo = {}
+        first = cache.tree_hash(self.path, memo)
+        self.assertEqual(len(memo), 2)
+
+        # Build outputs do not affect the hash
+        self.make_output()
+        self.assertEqual(cache.tree_hash(self.path, memo), first)
+
+        (self.path / "addons" / "main" / "config.cpp").write_text("class CfgPatches { class test {}; };")
+        self.assertNotEqual(cache.tree_hash(self.path, memo), first)
+
+        # Removed files are pruned from memo
+        (self.path / "addons" / "main" / "config.cpp").unlink()
+        cache.tree_hash(self.path, memo)
+        self.assertEqual(list(memo), [str(self.path / ".hemtt" / "project.toml")])
+
+    @unittest.skipIf(os.name == "nt", "symlinks require privileges")
+    def test_tree_hash_symlinks(self):
+        include = Path(self.tmp.name) / "include"
+        include.mkdir()
+        (include / "macros.hpp").write_text("#define TEST")
+        (self.path / "include").symlink_to(include, target_is_directory=True)
+        (include / "loop").symlink_to(self.path, target_is_directory=True)
+        (self.path / "broken").symlink_to(Path(self.tmp.name) / "missing")
+
+        memo = {}
+        first = cache.tree_hash(self.path, memo)
+        self.assertIn(str(self.path / "include" / "macros.hpp"), memo)
+
+        (include / "macros.hpp").write_text("#define TEST 1")
+        self.assertNotEqual(cache.tree_hash(self.path, memo), first)
+
+    def test_build_key(self):
+        key = cache.build_key(self.path, ["hemtt", "dev"], "dev")
+        self.assertEqual(key, cache.build_key(self.path, ["hemtt", "dev"], "dev"))
+        self.assertNotEqual(key, cache.build_key(self.path, ["hemtt", "build"], "build"))
+        self.assertNotEqual(key, cache.build_key(self.path, ["hemtt", "dev"], "dev", version="HEMTT 1.0.0"))
+
+    def test_store_restore(self):
+        output = self.make_output()
+        self.assertIsNone(cache.lookup(self.cache_dir, "key"))
+        self.assertTrue(cache.store(self.cache_dir, "key", output))
+        self.assertFalse(cache.store(self.cache_dir, "key", output))
+
+        target = Path(self.tmp.name) / "restored"
+        for link in [False, True]:
+            cache.restore(cache.lookup(self.cache_dir, "key"), target, link=link)
+            self.assertEqual((target / "addons" / "main.pbo").read_text(), "pbo")
+
+    def test_restore_missing(self):
+        target = self.make_output()
+        with self.assertRaises(OSError):
+            cache.restore(self.cache_dir / "missing", target)
+        self.assertEqual((target / "addons" / "main.pbo").read_text(), "pbo")
+        self.assertEqual(list(target.parent.iterdir()), [target])
+
+    def test_store_unique(self):
+        output = self.make_output()
+        self.cache_dir.mkdir()
+        (self.cache_dir / f".key.{os.getpid()}.tmp").mkdir()  # Same name from another workstation
+        self.assertTrue(cache.store(self.cache_dir, "key", output))
+
+    def test_evict(self):
+        output = self.make_output("x" * 100)
+        cache.store(self.cache_dir, "old", output)
+        cache.store(self.cache_dir, "new", output)
+        os.utime(self.cache_dir / "old", (0, 0))
+
+        evicted = cache.evict(self.cache_dir, 150)
+        self.assertEqual([x.name for x in evicted], ["old"])
+        self.assertTrue((self.cache_dir / "new").exists())
+
+    def test_build_mod_restore(self):
+        armaqdl.DRY = False
+        armaqdl.SETTINGS = {
+            "build": {"hemtt": {"presence": ".hemtt/project.toml", "command": ["hemtt", "dev"]}},
+            "cache": {"path": str(self.cache_dir)},
+        }
+        output = self.make_output()
+        key = cache.build_key(self.path, ["hemtt", "dev"], "dev", cache.load_memo(), cache.tool_version(["hemtt", "dev"]))
+        cache.store(self.cache_dir, key, output)
+        (output / "addons" / "main.pbo").unlink()
+
+        with io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                self.assertTrue(armaqdl.build_mod(self.path, "b", launch_type="dev"))
+            self.assertIn("Restoring from cache", f.getvalue())
+        self.assertTrue((output / "addons" / "main.pbo").exists())
+
+    def test_process_mods_first_build(self):
+        # Fresh checkout without build output is restored from cache
+        armaqdl.DRY = False
+        armaqdl.SETTINGS = {
+            "build": {"hemtt": {"presence": ".hemtt/project.toml", "command": ["hemtt", "dev"]}},
+            "cache": {"path": str(self.cache_dir)},
+        }
+        output = self.make_output()
+        key = cache.build_key(self.path, ["hemtt", "dev"], "dev", cache.load_memo(), cache.tool_version(["hemtt", "dev"]))
+        cache.store(self.cache_dir, key, output)
+        shutil.rmtree(self.path / ".hemttout")
+
+        with io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                self.assertEqual(armaqdl.process_mods([f"abs:{self.path}:b"], None), f"-mod={output}")
+            self.assertIn("Restoring from cache", f.getvalue())
+
+    @unittest.skipIf(os.name == "nt", "build command requires a POSIX shell")
+    def test_build_mod_cache_unavailable(self):
+        armaqdl.DRY = False
+        self.cache_dir.write_text("not a folder")
+        armaqdl.SETTINGS = {
+            "build": {"test": {"presence": ".hemtt/project.toml", "command": ["true"]}},
+            "cache": {"path": str(self.cache_dir)},
+        }
+        self.make_output()
+
+        with io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                self.assertTrue(armaqdl.build_mod(self.path, "b", launch_type="dev"))
+            self.assertIn("Cache skipped! Unable to store", f.getvalue())
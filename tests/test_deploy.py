@@ -0,0 +1,100 @@
+import hashlib
+import os
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from armaqdl import deploy
+
+
+def read_pbo(path):
+    data = path.read_bytes()
+    assert data[-21] == 0 and hashlib.sha1(data[:-21]).digest() == data[-20:], "Invalid checksum"
+
+    entries = []
+    pos = 0
+    while True:
+        end = data.index(b"\0", pos)
+        name = data[pos:end].decode("utf-8")
+        mime, _, _, _, size = struct.unpack_from("<5I", data, end + 1)
+        pos = end + 21
+        if mime == deploy.PBO_VERSION:
+            while data[pos] != 0:  # Properties
+                pos = data.index(b"\0", data.index(b"\0", pos) + 1) + 1
+            pos += 1
+        elif not name:
+            break
+        else:
+            entries.append((name, size))
+
+    files = {}
+    for name, size in entries:
+        files[name] = data[pos:pos + size]
+        pos += size
+    return files
+
+
+class UnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = Path(self.tmp.name) / "profile" / "test.VR"
+        self.target = Path(self.tmp.name) / "MPMissions" / "test.VR"
+        (self.source / "scripts").mkdir(parents=True)
+        (self.source / "mission.sqm").write_text("version=54;")
+        (self.source / "scripts" / "init.sqf").write_text("hint 'a';")
+        self.target.parent.mkdir()
+
+        patcher = mock.patch.object(deploy, "CONFIG_DIR", Path(self.tmp.name) / "config")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_copy_delta(self):
+        self.assertEqual(deploy.deploy("copy", self.source, self.target), 20)
+        self.assertEqual(deploy.deploy("copy", self.source, self.target), 0)
+
+        (self.source / "scripts" / "init.sqf").write_text("hint 'ab';")
+        (self.target / "stale.sqf").write_text("")
+        self.assertEqual(deploy.deploy("copy", self.source, self.target), 10)
+        self.assertFalse((self.target / "stale.sqf").exists())
+        self.assertEqual((self.target / "scripts" / "init.sqf").read_text(), "hint 'ab';")
+
+    def test_hardlink(self):
+        self.assertEqual(deploy.deploy("hardlink", self.source, self.target), 0)
+        self.assertTrue(os.path.samefile(self.source / "mission.sqm", self.target / "mission.sqm"))
+
+    @unittest.skipIf(os.name == "nt", "symbolic links may require privileges")
+    def test_symlink_replace(self):
+        deploy.deploy("symlink", self.source, self.target)
+        self.assertTrue(deploy.is_link(self.target))
+
+        # Replacing a link must not remove the source
+        deploy.deploy("copy", self.source, self.target)
+        self.assertFalse(deploy.is_link(self.target))
+        self.assertTrue((self.source / "mission.sqm").exists())
+
+    def test_pbo(self):
+        pbo = self.target.with_name("test.VR.pbo")
+        deploy.deploy("copy", self.source, self.target)
+        self.assertEqual(deploy.deploy("pbo", self.source, self.target), pbo.stat().st_size)
+        self.assertFalse(self.target.exists())
+        self.assertEqual(read_pbo(pbo), {"mission.sqm": b"version=54;", "scripts\\init.sqf": b"hint 'a';"})
+
+        # Unchanged
+        self.assertEqual(deploy.deploy("pbo", self.source, self.target), 0)
+
+        # Same layout, patched in place
+        (self.source / "scripts" / "init.sqf").write_text("hint 'b';")
+        os.utime(self.source / "scripts" / "init.sqf", (1, 1))
+        self.assertEqual(deploy.deploy("pbo", self.source, self.target), 9 + 4 + 21)
+        self.assertEqual(read_pbo(pbo)["scripts\\init.sqf"], b"hint 'b';")
+
+        # Different layout, rewritten
+        (self.source / "description.ext").write_text("onLoadName = 'Test';")
+        self.assertEqual(deploy.deploy("pbo", self.source, self.target), pbo.stat().st_size)
+        self.assertEqual(len(read_pbo(pbo)), 3)
@@ -0,0 +1,158 @@
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+FAKE_ARMA = Path(__file__).parent / "fake_arma.py"
+ROOT = Path(__file__).parent.parent
+
+SETTINGS = """
+profile = "Dev"
+
+[log]
+  open_delay = 10
+  path = "{rpt}"
+
+[server]
+  profile = "Server"
+  port = {port}
+  password = "test"
+"""
+
+SERVER_CFG = """class Missions {
+    class Test {
+        template = "mission.vr";
+    };
+};
+"""
+
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "config folder is only isolated with XDG_CONFIG_HOME on Linux")
+class LaunchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        self.launched = []
+
+        # Arma folder (current directory on Linux) with stand-in executable
+        self.arma = self.path / "arma"
+        self.arma.mkdir()
+        (self.arma / "server.cfg").write_text(SERVER_CFG)
+        self.executable = self.arma / "arma3_x64"
+        self.executable.write_text(FAKE_ARMA.read_text().replace("#!/usr/bin/env python3", f"#!{sys.executable}", 1))
+        self.executable.chmod(0o755)
+
+        # Isolated config (skip update check)
+        self.rpt = self.path / "rpt"
+        self.config = self.path / "config"
+        self.config.mkdir()
+        self.port = free_port()
+        (self.config / "settings.toml").write_text(SETTINGS.format(rpt=self.rpt.as_posix(), port=self.port))
+        (self.path / "xdg" / "ArmaQDL").mkdir(parents=True)
+        (self.path / "xdg" / "ArmaQDL" / "latest").write_text("0.0.0")
+
+        self.env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONPATH=str(ROOT), XDG_CONFIG_HOME=str(self.path / "xdg"),
+                        ARMAQDL_FAKE_RPT=str(self.rpt))
+
+    def tearDown(self):
+        for pid, rpt in self.launched:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                continue
+
+            # Wait for exit (last log line)
+            for _ in range(50):
+                if "Class destroyed" in rpt.read_text():
+                    break
+                time.sleep(0.1)
+
+        self.tmp.cleanup()
+
+    def make_mods(self, count):
+        mods = []
+        for i in range(count):
+            mod = self.path / "mods" / f"@mod{i}" / "addons"
+            mod.mkdir(parents=True, exist_ok=True)
+            (mod / f"mod{i}_main.pbo").write_bytes(b"\0" * 1024)
+            mods.append(str(mod.parent))
+        return mods
+
+    def launch(self, args):
+        # Returns latencies from CLI start to process spawned and RPT detected, and the RPT
+        start = time.time()
+        cmd = [sys.executable, "-m", "armaqdl"] + args + ["-e", str(self.executable), "--config", str(self.config)]
+        process = subprocess.Popen(cmd, cwd=self.arma, env=self.env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+        rpt, detected, output = None, None, ""
+        for line in process.stdout:
+            output += line
+            if line.startswith("Log: [") and detected is None:
+                detected = time.time()
+                rpt = Path(line.strip()[len("Log: ["):-1])
+        process.wait(timeout=30)
+
+        self.assertEqual(process.returncode, 0, output)
+        self.assertIsNotNone(rpt, output)
+
+        rpt_text = rpt.read_text()
+        info = dict(line.split(": ", 1) for line in rpt_text.splitlines() if line.startswith(("Started: ", "PID: ")))
+        self.launched.append((int(info["PID"]), rpt))
+
+        return {"spawn": float(info["Started"]) - start, "rpt": detected - start}, rpt_text
+
+    def test_launch(self):
+        mods = self.make_mods(2)
+        latency, rpt = self.launch(mods + ["-p", "Tester"])
+
+        self.assertIn("-name=Tester", rpt)
+        self.assertIn(f"Loading mod {mods[1]}", rpt)
+        self.assertLess(latency["spawn"], latency["rpt"])
+
+    def test_launch_server(self):
+        mission = self.path / "missions" / "test.VR"
+        mission.mkdir(parents=True)
+        (mission / "mission.sqm").write_text("version=54;")
+
+        _, rpt = self.launch(["none", "-s", "-m", str(mission)])
+        self.assertIn(f"-port={self.port}", rpt)
+        self.assertTrue((self.arma / "MPMissions" / "test.VR" / "mission.sqm").exists())
+        self.assertIn('template = "test.VR";', (self.arma / "ArmaQDL" / "server_0.cfg").read_text())
+
+        # Server is listening
+        for _ in range(50):
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        else:
+            self.fail("Server not listening")
+
+    def test_latency_benchmark(self):
+        results = {}
+        for count in [1, 10, 40]:
+            mods = self.make_mods(count)
+            runs = [self.launch(mods)[0] for _ in range(3)]
+            results[count] = {key: statistics.median(x[key] for x in runs) for key in ["spawn", "rpt"]}
+
+        print("\nLaunch latency (median of 3, from CLI start)")
+        print(f"{'Mods':>6} {'Spawned (ms)':>14} {'RPT detected (ms)':>19}")
+        for count, result in results.items():
+            print(f"{count:>6} {result['spawn'] * 1000:>14.1f} {result['rpt'] * 1000:>19.1f}")
+
+        for result in results.values():
+            self.assertLess(result["rpt"], 10)  # Detected before open delay fallback
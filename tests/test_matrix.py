@@ -0,0 +1,141 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from armaqdl import api, armaqdl, config, matrix, missions, update
+
+SETTINGS = """
+[server]
+  port = 2302
+"""
+
+# Exits with the code given as profile name, leaves a marker file
+EXECUTABLE = """
+import sys
+from pathlib import Path
+
+(Path(__file__).parent / "RAN").touch()
+for arg in sys.argv[1:]:
+    if arg.startswith("-name="):
+        sys.exit(int(arg[6:]))
+"""
+
+
+@unittest.skipIf(os.name == "nt", "stand-in executable requires a shebang")
+class UnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        (self.path / "settings.toml").write_text(SETTINGS)
+
+        self.executable = self.path / "arma3_x64"
+        self.executable.write_text(f"#!{sys.executable}\n{EXECUTABLE}")
+        self.executable.chmod(0o755)
+
+        patcher = mock.patch.object(missions, "CONFIG_DIR", self.path / "config")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_plan(self):
+        launcher = api.Launcher(self.path)
+        plan = launcher.plan(["none", "-p", "3", "-e", str(self.executable)])
+        self.assertTrue(plan.ok)
+        self.assertEqual(plan.command[0], str(self.executable))
+        self.assertIn("-name=3", plan.params)
+        self.assertIn("Launching without any mods", plan.output)
+
+        self.assertEqual(launcher.run(plan).returncode, 3)
+
+    def test_plan_invalid(self):
+        launcher = api.Launcher(self.path)
+        plans = [launcher.plan(["none", "-e", str(self.path / "missing")]), launcher.plan(["none", "--instance", "x"]),
+                 launcher.plan(["/missing/@mod", "-e", str(self.executable)])]
+        self.assertEqual([plan.code for plan in plans], [2, 2, 3])
+        self.assertEqual([plan.error for plan in plans], ["Invalid Arma path", "Invalid arguments", "Invalid mod(s)"])
+        self.assertEqual(launcher.plan(["none", "-e", str(self.executable)]).error, "")
+
+    def test_plan_state(self):
+        armaqdl.SETTINGS = {"previous": True}
+        api.Launcher(self.path, settings={"server": {"port": 2302}}, dry=True).plan(["none"])
+        self.assertEqual(armaqdl.SETTINGS, {"previous": True})
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            api.Launcher(self.path, settings={})
+
+    def test_run_matrix(self):
+        launch_matrix = {
+            "executable": str(self.executable),
+            "concurrency": 2,
+            "runs": [
+                {"name": "ok", "args": ["none", "-p", "0"]},
+                {"name": "fail", "args": ["none", "-p", "1"]},
+                {"args": ["/missing/@mod"]},
+            ],
+        }
+        report = matrix.run_matrix(launch_matrix, self.path)
+
+        self.assertEqual([run["name"] for run in report["runs"]], ["ok", "fail", "/missing/@mod"])
+        self.assertEqual([run["returncode"] for run in report["runs"]], [0, 1, None])
+        self.assertEqual(report["runs"][2]["resolve_code"], 3)
+        self.assertEqual([matrix.succeeded(run) for run in report["runs"]], [True, False, False])
+        self.assertEqual([run["executed"] for run in report["runs"]], [True, True, False])
+        json.dumps(report)
+
+    def test_run_matrix_dry(self):
+        launch_matrix = {"executable": str(self.executable), "runs": [{"args": ["none", "-p", "1"]}]}
+        report = matrix.run_matrix(launch_matrix, self.path, dry=True)
+
+        self.assertFalse((self.path / "RAN").exists())
+        self.assertFalse(report["runs"][0]["executed"])
+        self.assertIsNone(report["runs"][0]["returncode"])
+        self.assertTrue(matrix.succeeded(report["runs"][0], dry=True))
+
+    def test_server_instances(self):
+        (self.path / "matrix.toml").write_text('[[runs]]\nargs = ["none", "-s", "-i", "1"]\n[[runs]]\nargs = ["none", "-s", "--instance=1"]\n')
+        with io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                self.assertIsNone(matrix.load(self.path / "matrix.toml"))
+            self.assertIn("Server instance 1 used by runs 0 and 1", f.getvalue())
+
+        launch_matrix = {
+            "executable": str(self.executable),
+            "runs": [{"args": ["none", "-s"]}, {"args": ["none", "-s", "-i", "0"]}, {"args": ["none", "-s"]}, {"args": ["none"]}],
+        }
+        report = matrix.run_matrix(launch_matrix, self.path, dry=True)
+        self.assertEqual([run["args"][-2:] for run in report["runs"]],
+                         [["-i", "1"], ["-e", str(self.executable)], ["-i", "2"], ["-e", str(self.executable)]])
+
+    def test_side_effects(self):
+        self.assertFalse(matrix.has_side_effects(matrix.parse_run(["main:cba", "dev:ace:t", "-m", "test.VR"])))
+        self.assertTrue(matrix.has_side_effects(matrix.parse_run(["main:cba", "-s"])))
+        self.assertTrue(matrix.has_side_effects(matrix.parse_run(["dev:ace:bhemtt"])))
+        self.assertTrue(matrix.has_side_effects(matrix.parse_run(["dev:ace", "-b"])))
+
+    def test_matrix_main(self):
+        (self.path / "matrix.toml").write_text(f'executable = "{self.executable}"\n[[runs]]\nargs = ["none", "-p", "0"]\n')
+        argv = ["armaqdl", "--config", str(self.path), "--matrix", str(self.path / "matrix.toml"),
+                "--report", str(self.path / "report.json")]
+        for patcher in [mock.patch.object(sys, "argv", argv), mock.patch.object(config, "generate"),
+                        mock.patch.object(update, "clean"), mock.patch.object(update, "check")]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        with io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                ret = armaqdl.main()
+            self.assertEqual(ret, 0)
+            self.assertIn("Total runs: 1", f.getvalue())
+
+        with open(self.path / "report.json", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["runs"][0]["returncode"], 0)
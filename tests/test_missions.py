@@ -0,0 +1,79 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from armaqdl import armaqdl, missions
+
+
+class UnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.profiles = Path(self.tmp.name) / "profiles"
+        self.extra = Path(self.tmp.name) / "extra"
+
+        self.add_mission(self.profiles / "Dev" / "missions", "test.VR", 100)
+        self.add_mission(self.profiles / "Dev" / "mpmissions", "testing.Altis", 200)
+        self.add_mission(self.profiles / "Other" / "missions", "coop.Stratis", 300)
+        self.add_mission(self.extra, "training.Malden", 400)
+
+        for name, value in [("PROFILES_PATH", self.profiles), ("CONFIG_DIR", Path(self.tmp.name) / "config")]:
+            patcher = mock.patch.object(missions, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def add_mission(self, root, name, modified):
+        path = root / name
+        path.mkdir(parents=True)
+        (path / "mission.sqm").write_text("version=54;")
+        os.utime(path / "mission.sqm", (modified, modified))
+
+    def test_refresh(self):
+        mission_list = missions.refresh([self.extra])
+        self.assertEqual([x["name"] for x in mission_list], ["training.Malden", "coop.Stratis", "testing.Altis", "test.VR"])
+        self.assertEqual(mission_list[-1]["terrain"], "VR")
+        self.assertEqual(mission_list[-1]["profile"], "Dev")
+
+        # Incremental refresh picks up new missions and modifications
+        self.add_mission(self.profiles / "Dev" / "missions", "new.VR", 500)
+        os.utime(self.extra / "training.Malden" / "mission.sqm", (600, 600))
+        mission_list = missions.refresh([self.extra])
+        self.assertEqual([x["name"] for x in mission_list][:2], ["training.Malden", "new.VR"])
+
+    def test_find(self):
+        mission_list = missions.refresh([self.extra])
+        self.assertEqual([x["name"] for x in missions.find(mission_list, "TEST.vr")], ["test.VR"])
+        self.assertEqual([x["name"] for x in missions.find(mission_list, "test")], ["testing.Altis", "test.VR"])
+        self.assertEqual([x["name"] for x in missions.find(mission_list, "coop.stratiss")], ["coop.Stratis"])
+        self.assertEqual(missions.find(mission_list, "nothing"), [])
+
+    def test_find_profile(self):
+        mission_list = missions.refresh()
+        self.assertEqual([x["name"] for x in missions.find(mission_list, "c", "Dev")], ["coop.Stratis"])
+        self.assertEqual([x["name"] for x in missions.find(mission_list, "test", "Other")], ["testing.Altis", "test.VR"])
+
+        # Match tier is ranked before profile
+        self.add_mission(self.profiles / "Other" / "missions", "testing.Altis", 50)
+        self.add_mission(self.profiles / "Dev" / "missions", "tost.VR", 600)
+        self.add_mission(self.profiles / "Other" / "missions", "tost.Stratis", 700)
+        mission_list = missions.refresh()
+        self.assertEqual([x["name"] for x in missions.find(mission_list, "test.VR", "Other")], ["test.VR"])
+        found = missions.find(mission_list, "testing.altis", "Other")
+        self.assertEqual([x["profile"] for x in found], ["Other", "Dev"])
+        found = missions.find(mission_list, "tost", "Dev")
+        self.assertEqual([(x["name"], x["profile"]) for x in found], [("tost.VR", "Dev"), ("tost.Stratis", "Other")])
+
+    def test_process_mission(self):
+        armaqdl.SETTINGS = {"missions": {"paths": [str(self.extra)]}}
+        with io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                self.assertEqual(armaqdl.process_mission("test.VR", "Dev"), self.profiles / "Dev" / "missions" / "test.VR" / "mission.sqm")
+                self.assertEqual(armaqdl.process_mission("train", "Dev"), self.extra / "training.Malden" / "mission.sqm")
+                self.assertIsNone(armaqdl.process_mission("nothing", "Dev"))
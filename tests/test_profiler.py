@@ -0,0 +1,95 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from armaqdl import armaqdl, profiler
+
+RPT = """=====================================================================
+== arma3_x64.exe
+=====================================================================
+ 0:00:01 Initializing stats manager.
+ 0:00:04 Updating base class ->Default, by x\\cba\\addons\\main\\config.bin/CfgVehicles/
+ 0:00:10 Updating base class ->Default, by z\\ace\\addons\\common\\config.bin/CfgVehicles/
+ 0:00:11 Unrelated line mentioning an interface.
+ 0:00:15 Warning Message: ace_medical: missing texture
+"""
+
+
+class UnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+
+        for mod, pbos in [("@CBA_A3", ["cba_main"]), ("@ace", ["ace_common", "ace_medical"])]:
+            (self.path / mod / "addons").mkdir(parents=True)
+            (self.path / mod / "mod.cpp").write_text("name = 'test';")
+            for pbo in pbos:
+                (self.path / mod / "addons" / f"{pbo}.pbo").write_bytes(b"x" * 100)
+
+        self.mods = [self.path / "@CBA_A3", self.path / "@ace"]
+        self.rpt = self.path / "arma3_x64.rpt"
+        self.rpt.write_text(RPT)
+
+        patcher = mock.patch.object(profiler, "CONFIG_DIR", self.path / "config")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_mods_stats(self):
+        stats = profiler.mods_stats(self.mods)
+        self.assertEqual([(x["pbos"], x["pbo_size"], x["files"]) for x in stats], [(1, 100, 2), (2, 200, 3)])
+        self.assertEqual(stats[1]["pbo_names"], ["ace_common", "ace_medical"])
+
+    def test_mod_name(self):
+        self.assertEqual(profiler.mod_name(self.path / "ace" / ".hemttout" / "dev"), "ace")
+        self.assertEqual(profiler.mod_name(self.path / "@ace"), "@ace")
+
+    def test_parse_time(self):
+        self.assertEqual(profiler.parse_time(" 1:02:03 Line"), 3723)
+        self.assertEqual(profiler.parse_time("12:00:00.5 Line"), 43200.5)
+        self.assertIsNone(profiler.parse_time("== arma3_x64.exe"))
+
+    def test_find_mod(self):
+        tokens = profiler.mod_tokens(profiler.mods_stats(self.mods))
+        self.assertEqual(profiler.find_mod("Loading @CBA_A3 and @ace", tokens), 0)
+        self.assertEqual(profiler.find_mod("Warning: ace_medical\\x", tokens), 1)
+        self.assertIsNone(profiler.find_mod("Unrelated interface line", tokens))
+
+    def test_parse_rpt(self):
+        stats = profiler.mods_stats(self.mods)
+        times, lines = profiler.parse_rpt(self.rpt, stats)
+        self.assertEqual(times, [3, 10])
+        self.assertEqual(lines, [1, 2])
+
+        # Incremental (only appended lines are parsed), midnight wrap
+        with open(self.rpt, "a", encoding="utf-8") as f:
+            f.write("23:59:59 Reset\n 0:00:01 x\\cba\\addons\\main\n 0:00:02 partial ace")
+        times, lines = profiler.parse_rpt(self.rpt, stats)
+        self.assertEqual(times, [5, 10])
+        self.assertEqual(lines, [2, 2])
+
+    def test_bisect(self):
+        costs = {"a": 1, "b": 2, "c": 10, "d": 3}
+
+        slowest, results = profiler.bisect(list(costs), lambda subset: sum(costs[x] for x in subset))
+        self.assertEqual(slowest, "c")
+        self.assertEqual(results[:2], [(["a", "b"], 3), (["c", "d"], 13)])
+
+    def test_bisect_failed(self):
+        self.assertEqual(profiler.bisect(["a", "b"], lambda subset: None), (None, []))
+
+    def test_profile_mods_dry(self):
+        armaqdl.DRY = True
+        self.addCleanup(setattr, armaqdl, "DRY", False)
+        armaqdl.SETTINGS = {}
+        with mock.patch.object(armaqdl, "find_rpt_dir", return_value=self.path), io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                ret = armaqdl.profile_mods(self.path / "arma3_x64", [f"-mod={';'.join(map(str, self.mods))}"], True)
+            self.assertEqual(ret, 0)
+            self.assertIn("bisect skipped", f.getvalue())
@@ -0,0 +1,105 @@
+import argparse
+import contextlib
+import io
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from armaqdl import armaqdl, server
+
+SERVER_CFG = """hostname = "Test";
+class Missions {
+    class Test {
+        template = "mission.vr";
+    };
+};
+"""
+
+
+class UnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        (self.path / "server.cfg").write_text(SERVER_CFG)
+        armaqdl.DRY = False
+
+        patcher = mock.patch.object(armaqdl, "find_arma", return_value=self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def args(self, instance=0):
+        return argparse.Namespace(instance=instance, config=self.path, no_filepatching=True, no_debug=True, check_signatures=False)
+
+    def test_render_plain(self):
+        cfg = server.render(SERVER_CFG, {"mission": "test.VR"})
+        self.assertIn('template = "test.VR";', cfg)
+        self.assertEqual(server.render(SERVER_CFG, {"mission": ""}), SERVER_CFG)
+
+        # Plain configs are not substituted
+        plain = 'hostname = "$port test";\npassword = "a$$b";\n'
+        self.assertEqual(server.render(plain, {"mission": "test.VR", "port": 2302}), plain)
+
+    def test_render_placeholders(self):
+        values = {"mission": "test.VR", "password": "secret", "missions": server.render_missions(["test.VR", "coop.Altis"], "Regular")}
+        cfg = server.render('password = "$password";\n$missions\n', values, placeholders=True)
+        self.assertIn('password = "secret";', cfg)
+        self.assertIn('class Mission1 {\n        template = "coop.Altis";\n        difficulty = "Regular";', cfg)
+
+    def test_write_atomic(self):
+        cfg_path = self.path / "out" / "server.cfg"
+        self.assertTrue(server.write_atomic(cfg_path, "a"))
+        self.assertFalse(server.write_atomic(cfg_path, "a"))
+        self.assertTrue(server.write_atomic(cfg_path, "b"))
+        self.assertEqual(cfg_path.read_text(), "b")
+        self.assertEqual(list(cfg_path.parent.iterdir()), [cfg_path])
+
+    def test_write_atomic_concurrent(self):
+        cfg_path = self.path / "server.cfg"
+        texts = [str(i) * 100000 for i in range(8)]
+        threads = [threading.Thread(target=server.write_atomic, args=(cfg_path, text)) for text in texts]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertIn(cfg_path.read_text(), texts)
+
+    def test_flags_server_instances(self):
+        armaqdl.SETTINGS = {"server": {"profile": "Server", "port": 2302}}
+        with io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                flags = armaqdl.process_flags_server(self.args(), "test.VR")
+                flags_instance = armaqdl.process_flags_server(self.args(1), "other.VR")
+
+        self.assertIn("-port=2302", flags)
+        self.assertIn(f"-config={self.path / 'ArmaQDL' / 'server_0.cfg'}", flags)
+        self.assertIn("-port=2312", flags_instance)
+        self.assertIn("-name=Server1", flags_instance)
+        self.assertIn('template = "test.VR";', (self.path / "ArmaQDL" / "server_0.cfg").read_text())
+        self.assertIn('template = "other.VR";', (self.path / "ArmaQDL" / "server_1.cfg").read_text())
+        self.assertEqual((self.path / "server.cfg").read_text(), SERVER_CFG)
+
+    def test_flags_server_template(self):
+        (self.path / "basic.cfg").write_text("MaxMsgSend = 128;\n")
+        (self.path / "template.cfg").write_text("$missions\n")
+        armaqdl.SETTINGS = {"server": {"config": "template.cfg", "basic": "basic.cfg", "missions": ["coop.Altis"]}}
+        with io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                flags = armaqdl.process_flags_server(self.args(), "test.VR")
+
+        self.assertIn(f"-cfg={self.path / 'ArmaQDL' / 'basic_0.cfg'}", flags)
+        cfg = (self.path / "ArmaQDL" / "template_0.cfg").read_text()
+        self.assertIn('template = "test.VR";', cfg)
+        self.assertIn('template = "coop.Altis";', cfg)
+
+    def test_flags_server_missing(self):
+        armaqdl.SETTINGS = {"server": {"config": "missing.cfg"}}
+        with io.StringIO() as f:
+            with contextlib.redirect_stdout(f):
+                self.assertIsNone(armaqdl.process_flags_server(self.args(), "test.VR"))
+            self.assertIn("template not found", f.getvalue())
@@ -0,0 +1,81 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from armaqdl import watch
+
+
+class StopWatching(Exception):
+    pass
+
+
+class UnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        (self.path / "addons" / "main").mkdir(parents=True)
+        (self.path / "addons" / "main" / "config.cpp").write_text("class CfgPatches {};")
+        (self.path / ".hemttout" / "dev").mkdir(parents=True)
+        (self.path / ".hemttout" / "dev" / "main.pbo").write_text("pbo")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_snapshot_ignores(self):
+        files = watch.snapshot(self.path)
+        self.assertEqual(len(files), 1)
+        self.assertIn(str(self.path / "addons" / "main" / "config.cpp"), files)
+
+    def test_is_ignored(self):
+        self.assertTrue(watch.is_ignored(self.path / ".hemttout" / "dev" / "main.pbo", self.path))
+        self.assertFalse(watch.is_ignored(self.path / "addons" / "main" / "config.cpp", self.path))
+
+    def test_take_ready_debounce(self):
+        lock = threading.Lock()
+        pending = {"old": time.monotonic() - 1, "new": time.monotonic()}
+        self.assertEqual(watch.take_ready(pending, lock, 0.5), ["old"])
+        self.assertEqual(list(pending), ["new"])
+
+    def test_polling_change(self):
+        changes = []
+
+        def on_change(names):
+            changes.extend(names)
+            raise StopWatching()
+
+        def modify():
+            time.sleep(0.1)
+            (self.path / "addons" / "main" / "script.sqf").write_text("hint 'test';")
+
+        t = threading.Thread(target=modify)
+        t.start()
+        with self.assertRaises(StopWatching):
+            watch.watch_polling({"dev:mod": self.path}, on_change, interval=0.05, debounce=0.1)
+        t.join()
+
+        self.assertEqual(changes, ["dev:mod"])
+
+    def test_polling_change_during_build(self):
+        changes = []
+
+        def on_change(names):
+            changes.extend(names)
+            if len(changes) == 1:
+                (self.path / "addons" / "main" / "script.sqf").write_text("hint 'during build';")
+            else:
+                raise StopWatching()
+
+        def modify():
+            time.sleep(0.1)
+            (self.path / "addons" / "main" / "config.cpp").write_text("class CfgPatches { class Test {}; };")
+
+        t = threading.Thread(target=modify)
+        t.start()
+        with self.assertRaises(StopWatching):
+            watch.watch_polling({"dev:mod": self.path}, on_change, interval=0.05, debounce=0.1)
+        t.join()
+
+        self.assertEqual(changes, ["dev:mod", "dev:mod"])